@@ -1,4 +1,7 @@
 from enum import Enum
+from operator import attrgetter
+
+from .exceptions import DecodingError, UnknownEncodingScheme
 
 
 class HeaderHex(Enum):
@@ -15,13 +18,62 @@ class HeaderHex(Enum):
     SSCC = "31"
 
 
+class FilterValue(Enum):
+    """
+    Base enum for the filter values of a scheme.
+
+    The integer form of each value is stored on the member so that
+    encoding does not have to parse it on every call.
+    """
+
+    def __init__(self, value):
+        self.int_value = int(value)
+
+
 class EPC(object):
     """
     A class to represent an Electronic Product Code
+
+    EPCs hold many instances in bulk workloads, so the attributes are
+    declared as slots instead of using a per instance `__dict__`.
+    The data fields are read-only, so values derived from them can be
+    cached in the underscored slots on first use.
     """
 
+    __slots__ = (
+        "_company_prefix",
+        "default_binary_scheme",
+        "default_filter_value",
+        "_uri_body_parts",
+        "_pure_identity_uri",
+        "_gs1_element_string",
+        "_validated_schemes",
+        # Keep instances weakly referenceable, as they were before
+        # slots were added
+        "__weakref__",
+    )
+
+    # Names of the encode and validate methods for each binary scheme,
+    # and of the decode classmethod for each EPC header hex value.
+    # Subclasses fill these in for the schemes they support.
+    _encoders = {}
+    _validators = {}
+    _decoders = {}
+
+    company_prefix = property(attrgetter("_company_prefix"))
+
     def __eq__(self, other):
-        return self.pure_identity_uri == other.pure_identity_uri
+        # Two EPCs are equal when their pure identity URIs are. Compare
+        # the URI parts directly so that the URI does not have to be built.
+        if not isinstance(other, EPC):
+            return NotImplemented
+        return (
+            self.__scheme__ == other.__scheme__
+            and self.get_uri_body_parts() == other.get_uri_body_parts()
+        )
+
+    def __hash__(self):
+        return hash((self.__scheme__, self.get_uri_body_parts()))
 
     @property
     def company_prefix_digits(self):
@@ -29,7 +81,11 @@ class EPC(object):
 
     @property
     def gs1_element_string(self):
-        return self.get_gs1_element_string()
+        try:
+            return self._gs1_element_string
+        except AttributeError:
+            self._gs1_element_string = self.get_gs1_element_string()
+            return self._gs1_element_string
 
     def get_gs1_element_string(self):
         raise NotImplementedError()
@@ -42,15 +98,23 @@ class EPC(object):
         This URI only contains information about the EPC itself
         and *does not have* anything specific about how the tag
         will be encoded, stored or the
+
+        The URI is computed once and cached on the instance.
         """
+        try:
+            return self._pure_identity_uri
+        except AttributeError:
+            pass
+
         # X.Y.Z
         uri_body = ".".join(self.get_uri_body_parts())
 
         # urn:epc:id:sgtin:X.Y.Z
-        return ":".join(["urn:epc:id", self.__scheme__, uri_body])
+        self._pure_identity_uri = f"urn:epc:id:{self.__scheme__}:{uri_body}"
+        return self._pure_identity_uri
 
     def __repr__(self):
-        return "<{}>".format(self.pure_identity_uri)
+        return f"<{self.pure_identity_uri}>"
 
     def get_tag_uri(self, binary_scheme=None, filter_value=None):
         """
@@ -88,22 +152,17 @@ class EPC(object):
         # scheme make sense
         self.validate(binary_scheme)
 
-        # 1. Start with the tag prefix
-        parts = ["urn:epc:tag"]
-
+        # 1. Start with the tag prefix (urn:epc:tag)
         # 2. Add the binry coding scheme
-        parts.append(binary_scheme.value)
-
         # 3. Add the filter if one is specified
-        body_parts = self.get_uri_body_parts()
+        body = ".".join(self.get_uri_body_parts())
         if filter_value:
-            body_parts.insert(0, filter_value.value)
-        parts.append(".".join(body_parts))
+            body = f"{filter_value.value}.{body}"
 
         # 4/5 TODO: Handle attribute bits and user memory indicators
 
         # Return the tag uri
-        return ":".join(parts)
+        return f"urn:epc:tag:{binary_scheme.value}:{body}"
 
     def encode(self, binary_scheme=None, filter_value=None):
         """
@@ -129,10 +188,30 @@ class EPC(object):
         if filter_value is None:
             filter_value = self.default_filter_value
 
-        method_name = "encode_{}".format(binary_scheme.value.replace("-", "_"))
+        method_name = self._encoders.get(binary_scheme)
+        if method_name is None:
+            raise UnknownEncodingScheme(
+                "{} cannot be encoded with {}".format(self.__scheme__, binary_scheme)
+            )
 
         return getattr(self, method_name)(filter_value)
 
+    @classmethod
+    def decode(cls, epc_hex):
+        """
+        Decode and return an EPC object of this class from the given EPC.
+
+        The binary scheme is selected by the header (the first two
+        characters of the hex value).
+        """
+        header = epc_hex[:2]
+        method_name = cls._decoders.get(header)
+        if method_name is None:
+            raise DecodingError(
+                "{} is not a valid header for {}".format(header, cls.__name__)
+            )
+        return getattr(cls, method_name)(epc_hex)
+
     def guess_binary_scheme(self):
         """
         Guess the binary scheme if possible. If not possible,
@@ -145,10 +224,23 @@ class EPC(object):
         Validate the tag contents for binary scheme.
         For example, if the scheme is sgtin-96, the serial
         number must be numeric only without leading zeros.
+
+        Successful validations are remembered on the instance, so
+        generating tag URIs for the same scheme again skips the checks.
         """
-        validation_method = "validate_{}".format(binary_scheme.value.replace("-", "_"))
-        if hasattr(self, validation_method):
-            return getattr(self, validation_method)()
+        try:
+            validated_schemes = self._validated_schemes
+        except AttributeError:
+            validated_schemes = self._validated_schemes = set()
+
+        if binary_scheme in validated_schemes:
+            return True
+
+        validation_method = self._validators.get(binary_scheme)
+        if validation_method is not None:
+            rv = getattr(self, validation_method)()
+            validated_schemes.add(binary_scheme)
+            return rv
 
     def validate_company_prefix(self):
         """
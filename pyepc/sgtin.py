@@ -1,12 +1,14 @@
-from builtins import str
 from collections import namedtuple
 from enum import Enum
-import struct
+from operator import attrgetter
 
 from . import utils
-from .epc import EPC, HeaderHex
+from .epc import EPC, FilterValue, HeaderHex
 from .exceptions import EncodingError, DecodingError
 
+# Largest serial number that fits the 38 bits of sgtin-96
+SGTIN_96_MAX_SERIAL = (1 << 38) - 1
+
 
 class SGTIN(EPC):
     """
@@ -93,8 +95,22 @@ class SGTIN(EPC):
     """
 
     __scheme__ = "sgtin"
-
-    class FilterValues(Enum):
+    __slots__ = (
+        "_item_ref",
+        "_indicator",
+        "_serial_number",
+        "_item_ref_and_indicator",
+        "_gtin",
+        "_gtin_int",
+        "_serial_number_int",
+    )
+
+    # The data fields are read-only, see `EPC`
+    item_ref = property(attrgetter("_item_ref"))
+    indicator = property(attrgetter("_indicator"))
+    serial_number = property(attrgetter("_serial_number"))
+
+    class FilterValues(FilterValue):
         ALL_OTHERS = "0"
         POS_ITEM = "1"
         CASE = "2"
@@ -108,6 +124,18 @@ class SGTIN(EPC):
         SGTIN_96 = "sgtin-96"
         SGTIN_198 = "sgtin-198"
 
+    _encoders = {
+        BinarySchemes.SGTIN_96: "encode_sgtin_96",
+        BinarySchemes.SGTIN_198: "encode_sgtin_198",
+    }
+    _validators = {
+        BinarySchemes.SGTIN_96: "validate_sgtin_96",
+    }
+    _decoders = {
+        HeaderHex.SGTIN_96.value: "_decode_sgtin_96",
+        HeaderHex.SGTIN_198.value: "_decode_sgtin_198",
+    }
+
     # Implementation of SGTIN Partition table that identifies
     # partition value for different lengths of GS1 company
     # prefix
@@ -119,7 +147,9 @@ class SGTIN(EPC):
     # m - Company prefix - bits
     # l - Company prefix - digits
     # n - Item reference bits
-    PTR = namedtuple("PTR", "p m l n")
+    # m_mask, n_mask - Bit masks for the company prefix and item
+    # reference fields, derived from m and n for decoding
+    PTR = namedtuple("PTR", "p m l n m_mask n_mask", defaults=(None, None))
     partition_table = [
         PTR(p=0, m=40, l=12, n=4),
         PTR(p=1, m=37, l=11, n=7),
@@ -129,6 +159,14 @@ class SGTIN(EPC):
         PTR(p=5, m=24, l=7, n=20),
         PTR(p=6, m=20, l=6, n=24),
     ]
+    partition_table = [
+        ptr._replace(m_mask=(1 << ptr.m) - 1, n_mask=(1 << ptr.n) - 1)
+        for ptr in partition_table
+    ]
+    # Partition table rows indexed by company prefix digits (for
+    # encoding) and by partition value (for decoding)
+    _ptr_by_l = {ptr.l: ptr for ptr in partition_table}
+    _ptr_by_p = {ptr.p: ptr for ptr in partition_table}
 
     def __init__(
         self,
@@ -139,26 +177,49 @@ class SGTIN(EPC):
         default_binary_scheme=BinarySchemes.SGTIN_96,
         default_filter_value=FilterValues.POS_ITEM,
     ):
-        self.company_prefix = str(company_prefix)
+        # The data fields are read-only properties over these slots
+        self._company_prefix = str(company_prefix)
         self.validate_company_prefix()
 
-        self.item_ref = item_ref
-        self.indicator = indicator
-        # Length of company prefix + indicator + item reference
-        # must be 13. So if the item_ref length is
-        # smaller, pad with zeros
-        self.item_ref_and_indicator = "{}{}".format(indicator, item_ref).zfill(
-            13 - len(self.company_prefix)
-        )
-
-        self.serial_number = str(serial_number)
+        self._item_ref = item_ref
+        self._indicator = indicator
+        self._serial_number = str(serial_number)
 
         # Store the defaults for creating tag URIs.
         self.default_binary_scheme = default_binary_scheme
         self.default_filter_value = default_filter_value
 
+    @property
+    def item_ref_and_indicator(self):
+        """
+        The indicator digit followed by the item reference, as used
+        in the URIs. Computed on first use and cached.
+        """
+        try:
+            return self._item_ref_and_indicator
+        except AttributeError:
+            pass
+
+        # Length of company prefix + indicator + item reference
+        # must be 13. So if the item_ref length is
+        # smaller, pad with zeros
+        self._item_ref_and_indicator = f"{self.indicator}{self.item_ref}".rjust(
+            13 - len(self.company_prefix), "0"
+        )
+        return self._item_ref_and_indicator
+
     def get_uri_body_parts(self):
-        return [self.company_prefix, self.item_ref_and_indicator, self.serial_number]
+        try:
+            return self._uri_body_parts
+        except AttributeError:
+            pass
+
+        self._uri_body_parts = (
+            self.company_prefix,
+            self.item_ref_and_indicator,
+            self.serial_number,
+        )
+        return self._uri_body_parts
 
     def guess_binary_scheme(self):
         """
@@ -168,7 +229,7 @@ class SGTIN(EPC):
 
         If alpha numeric then default to sgtin-198
         """
-        if self.serial_number.isnumeric():
+        if self.serial_number.isascii() and self.serial_number.isdigit():
             return self.BinarySchemes.SGTIN_96
         return self.BinarySchemes.SGTIN_198
 
@@ -179,44 +240,60 @@ class SGTIN(EPC):
         is less than 2^38 (that is, from 0 through
         274,877,906,943, inclusive)
         """
-        if len(self.serial_number) > 1 and self.serial_number.startswith("0"):
+        serial_number = self.serial_number
+        if len(serial_number) > 1 and serial_number[0] == "0":
             raise EncodingError(
                 "`sgtin-96` encoding does not allow leading 0s for "
-                "serial numbers. Serial: '{}'".format(self.serial_number)
+                "serial numbers. Serial: '{}'".format(serial_number)
             )
-        try:
-            serial_number_int = int(self.serial_number)
-        except ValueError:
+        if not (serial_number.isascii() and serial_number.isdigit()):
             raise EncodingError(
                 "`sgtin-96` encoding requires numeric-only "
-                "serial numbers. Serial: '{}'".format(self.serial_number)
+                "serial numbers. Serial: '{}'".format(serial_number)
             )
 
-        if not 0 <= serial_number_int <= 274877906943:
+        # Only digits are left, so the value cannot be negative
+        serial_number_int = int(serial_number)
+        if serial_number_int > SGTIN_96_MAX_SERIAL:
             raise EncodingError(
                 "`sgtin-96` encoded serial numbers must be between 0 and "
-                "274,877,906,943. Serial: '{}'".format(self.serial_number)
+                "274,877,906,943. Serial: '{}'".format(serial_number)
             )
 
+        # Keep the parsed value for encode_sgtin_96
+        self._serial_number_int = serial_number_int
         return True
 
     def _encode_gtin(self):
         """
         Encode the GTIN part of the URI. This is common between
         sgtin-96 and sgtin-198
+
+        The digits are parsed and packed only once and the result is
+        cached on the instance for later encodes.
+
+        :return: The 47 bit GTIN as an integer
         """
-        for ptr in self.partition_table:
-            if ptr.l == self.company_prefix_digits:  # noqa
-                break
-        else:
+        try:
+            return self._gtin_int
+        except AttributeError:
+            pass
+
+        ptr = self._ptr_by_l.get(self.company_prefix_digits)
+        if ptr is None:
             raise EncodingError("Length of Company Prefix is invalid")
 
-        return utils.encode_partition_table(
-            ptr.p, self.company_prefix, ptr.m, self.item_ref_and_indicator, ptr.n, 47
+        self._gtin_int = utils.pack_fields(
+            [
+                (ptr.p, 3),
+                (int(self.company_prefix), ptr.m),
+                (int(self.item_ref_and_indicator), ptr.n),
+            ]
         )
+        return self._gtin_int
 
     @classmethod
-    def _decode_gtin(cls, gtin_binary):
+    def _decode_gtin(cls, gtin):
         """
         Decode the GTIN part of the epc binary
 
@@ -231,29 +308,21 @@ class SGTIN(EPC):
                   │    20-40     │    1     │              │
                   └──────────────┴──────────┴──────────────┘
 
+        :param gtin: The 47 bit GTIN as an integer
         :return: A tuple of company prefix, indicator and item ref
         """
-        assert len(gtin_binary) == 47
-
-        partition = int(utils.decode_integer(gtin_binary[:3]))
-        for ptr in cls.partition_table:
-            if ptr.p == partition:  # noqa
-                break
-        else:
+        partition = gtin >> 44
+        ptr = cls._ptr_by_p.get(partition)
+        if ptr is None:
             raise DecodingError("Length of Company Prefix is invalid")
 
-        rv = utils.decode_partition_table(
-            gtin_binary,
-            ptr.m,
-            ptr.l,
-            ptr.n,
-            # Total of 13 chars
-            13 - ptr.l,
-        )
+        company_prefix = str((gtin >> ptr.n) & ptr.m_mask).zfill(ptr.l)
+        # Total of 13 chars
+        item_ref_and_indicator = str(gtin & ptr.n_mask).zfill(13 - ptr.l)
         return (
-            rv[0],  # Company prefix
-            rv[1][0],  # Indicator digit
-            rv[1][1:],  # Item ref
+            company_prefix,
+            item_ref_and_indicator[0],  # Indicator digit
+            item_ref_and_indicator[1:],  # Item ref
         )
 
     def encode_sgtin_96(self, filter_value):
@@ -270,26 +339,30 @@ class SGTIN(EPC):
         # │    8     │  3   │    3    │    20-40     │  24-4  │  38  │
         # └──────────┴──────┴─────────┴──────────────┴────────┴──────┘
 
-        # EPC Header
-        # 8-bits
-        #
-        # for sgtin-96 is 0x30
-        binary = utils.encode_integer(0x30, 8)
-
-        # Filter
-        # 3 bits
-        binary += utils.encode_integer(int(filter_value.value), 3)
-
-        # GTIN = Partition + Company Prefix + Item Ref
-        # 47 bits
-        binary += self._encode_gtin()
-
-        # Serial
-        binary += utils.encode_integer(int(self.serial_number), 38)
+        try:
+            serial_number_int = self._serial_number_int
+        except AttributeError:
+            serial_number_int = self._serial_number_int = int(self.serial_number)
 
-        assert len(binary) == 96
+        binary = utils.pack_fields(
+            [
+                # EPC Header
+                # 8-bits
+                #
+                # for sgtin-96 is 0x30
+                (0x30, 8),
+                # Filter
+                # 3 bits
+                (filter_value.int_value, 3),
+                # GTIN = Partition + Company Prefix + Item Ref
+                # 47 bits
+                (self._encode_gtin(), 47),
+                # Serial
+                (serial_number_int, 38),
+            ]
+        )
 
-        return utils.bin_2_hex(binary)
+        return utils.int_2_hex(binary, 96)
 
     def encode_sgtin_198(self, filter_value):
         """
@@ -305,76 +378,68 @@ class SGTIN(EPC):
         # │    8     │  3   │    3    │    20-40     │  24-4  │ 140  │
         # └──────────┴──────┴─────────┴──────────────┴────────┴──────┘
 
-        # EPC Header
-        # 8-bits
-        #
-        # for sgtin-96 is 0x36
-        binary = utils.encode_integer(0x36, 8)
-
-        # Filter
-        # 3 bits
-        binary += utils.encode_integer(int(filter_value.value), 3)
-
-        # GTIN = Partition + Company Prefix + Item Ref
-        # 47 bits
-        binary += self._encode_gtin()
-
-        # Serial
-        binary += utils.encode_string(self.serial_number, 140)
-
-        assert len(binary) == 198
-
-        return utils.bin_2_hex(binary)
+        binary = utils.pack_fields(
+            [
+                # EPC Header
+                # 8-bits
+                #
+                # for sgtin-198 is 0x36
+                (0x36, 8),
+                # Filter
+                # 3 bits
+                (filter_value.int_value, 3),
+                # GTIN = Partition + Company Prefix + Item Ref
+                # 47 bits
+                (self._encode_gtin(), 47),
+                # Serial
+                (utils.pack_string(self.serial_number, 140), 140),
+            ]
+        )
 
-    @classmethod
-    def decode(cls, epc_hex):
-        """
-        Decode and return a gtin object from the given EPC.
-        """
-        header = epc_hex[:2]
-        if header == HeaderHex.SGTIN_96.value:
-            return cls._decode_sgtin_96(utils.hex_2_bin(epc_hex, 96))
-        elif header == HeaderHex.SGTIN_198.value:
-            return cls._decode_sgtin_198(utils.hex_2_bin(epc_hex, 198))
-        else:
-            raise DecodingError("{} is not a valid header for SGTIN".format(header))
+        return utils.int_2_hex(binary, 198)
 
     @classmethod
-    def _decode_sgtin_96(cls, epc_binary):
+    def _decode_sgtin_96(cls, epc_hex):
         """
         Decode and return a gtin object from the given EPC.
         """
-        if len(epc_binary) != 96:
+        if len(epc_hex) < 24:
             raise DecodingError(
-                "sgtin-96 EPCs should have 96 bits. Found {}".format(len(epc_binary))
+                "sgtin-96 EPCs should have 96 bits. Found {}".format(len(epc_hex) * 4)
             )
         # ┌──────────┬──────┬─────────────────────────────────┬──────┐
         # │EPC HEADER│FILTER│              GTIN               │SERIAL│
         # │    8     │  3   │               47                │ 38   │
         # └──────────┴──────┴─────────────────────────────────┴──────┘
-        sgtin_96_struct = struct.Struct("8s 3s 47s 38s")
-        header, filter_value, gtin, serial = sgtin_96_struct.unpack(epc_binary)
+        epc_int = utils.hex_2_int(epc_hex, 96)
+        gtin = (epc_int >> 38) & ((1 << 47) - 1)
+        serial = epc_int & ((1 << 38) - 1)
         company_prefix, indicator, item_ref = cls._decode_gtin(gtin)
-        return cls(company_prefix, indicator, item_ref, utils.decode_integer(serial))
+        return cls(company_prefix, indicator, item_ref, str(serial))
 
     @classmethod
-    def _decode_sgtin_198(cls, epc_binary):
+    def _decode_sgtin_198(cls, epc_hex):
         """
         Decode and return a gtin object from the given EPC.
         """
-        if len(epc_binary) != 198:
+        if len(epc_hex) < 50:
             raise DecodingError(
-                "sgtin-198 EPCs should have 198 bits. Found {}".format(len(epc_binary))
+                "sgtin-198 EPCs should have 198 bits. Found {}".format(len(epc_hex) * 4)
             )
         # ┌──────────┬──────┬─────────────────────────────────┬──────┐
         # │EPC HEADER│FILTER│              GTIN               │SERIAL│
         # │    8     │  3   │               47                │ 140  │
         # └──────────┴──────┴─────────────────────────────────┴──────┘
-
-        sgtin_198_struct = struct.Struct("8s 3s 47s 140s")
-        header, filter_value, gtin, serial = sgtin_198_struct.unpack(epc_binary)
+        epc_int = utils.hex_2_int(epc_hex, 198)
+        gtin = (epc_int >> 140) & ((1 << 47) - 1)
+        serial = epc_int & ((1 << 140) - 1)
         company_prefix, indicator, item_ref = cls._decode_gtin(gtin)
-        return cls(company_prefix, indicator, item_ref, utils.decode_string(serial))
+        return cls(
+            company_prefix,
+            indicator,
+            item_ref,
+            utils.unpack_string(serial, 140),
+        )
 
     @classmethod
     def from_sgtin(cls, gtin, serial_number, company_prefix_len=None):
@@ -419,7 +484,15 @@ class SGTIN(EPC):
     def gtin(self):
         """
         Return the GTIN in "plain" syntax
+
+        The GTIN (and its check digit) is computed once and cached
+        on the instance.
         """
+        try:
+            return self._gtin
+        except AttributeError:
+            pass
+
         gtin_wo_check_digit = "".join(
             [
                 self.indicator,
@@ -427,19 +500,15 @@ class SGTIN(EPC):
                 self.item_ref.zfill(12 - len(self.company_prefix)),
             ]
         )
-        return gtin_wo_check_digit + utils.calculate_check_digit(gtin_wo_check_digit)
+        self._gtin = gtin_wo_check_digit + utils.calculate_check_digit(
+            gtin_wo_check_digit
+        )
+        return self._gtin
 
     def get_gs1_element_string(self):
         """
         Return a GS1 element string for SGTIN
         """
-        return "".join(
-            [
-                # GS1 Application identifier for GTIN is 01
-                "(01)",
-                self.gtin,
-                # GS1 Application identifier for serial number 21
-                "(21)",
-                self.serial_number,
-            ]
-        )
+        # GS1 Application identifier for GTIN is 01 and
+        # for serial number 21
+        return f"(01){self.gtin}(21){self.serial_number}"
@@ -1,10 +1,9 @@
-from builtins import str
 from collections import namedtuple
 from enum import Enum
-import struct
+from operator import attrgetter
 
 from . import utils
-from .epc import EPC
+from .epc import EPC, FilterValue, HeaderHex
 from .exceptions import EncodingError, DecodingError
 
 
@@ -65,8 +64,19 @@ class SSCC(EPC):
     """
 
     __scheme__ = "sscc"
-
-    class FilterValues(Enum):
+    __slots__ = (
+        "_extension_digit",
+        "_serial_ref",
+        "_extn_and_serial_ref",
+        "_sscc",
+        "_sscc_int",
+    )
+
+    # The data fields are read-only, see `EPC`
+    extension_digit = property(attrgetter("_extension_digit"))
+    serial_ref = property(attrgetter("_serial_ref"))
+
+    class FilterValues(FilterValue):
         ALL_OTHERS = "0"
         RESERVED_1 = "1"
         CASE = "2"
@@ -79,6 +89,10 @@ class SSCC(EPC):
     class BinarySchemes(Enum):
         SSCC_96 = "sscc-96"
 
+    _encoders = {BinarySchemes.SSCC_96: "encode_sscc_96"}
+    _validators = {BinarySchemes.SSCC_96: "validate_sscc_96"}
+    _decoders = {HeaderHex.SSCC.value: "_decode_sscc_96"}
+
     # Implementation of SSCC Partition table that identifies
     # partition value for different lengths of GS1 company
     # prefix
@@ -90,7 +104,9 @@ class SSCC(EPC):
     # m - Company prefix - bits
     # l - Company prefix - digits
     # n - Extension digit and serial reference bits
-    PTR = namedtuple("PTR", "p m l n")
+    # m_mask, n_mask - Bit masks for the company prefix and serial
+    # reference fields, derived from m and n for decoding
+    PTR = namedtuple("PTR", "p m l n m_mask n_mask", defaults=(None, None))
     partition_table = [
         PTR(p=0, m=40, l=12, n=18),
         PTR(p=1, m=37, l=11, n=21),
@@ -100,6 +116,14 @@ class SSCC(EPC):
         PTR(p=5, m=24, l=7, n=34),
         PTR(p=6, m=20, l=6, n=38),
     ]
+    partition_table = [
+        ptr._replace(m_mask=(1 << ptr.m) - 1, n_mask=(1 << ptr.n) - 1)
+        for ptr in partition_table
+    ]
+    # Partition table rows indexed by company prefix digits (for
+    # encoding) and by partition value (for decoding)
+    _ptr_by_l = {ptr.l: ptr for ptr in partition_table}
+    _ptr_by_p = {ptr.p: ptr for ptr in partition_table}
 
     def __init__(
         self,
@@ -109,27 +133,43 @@ class SSCC(EPC):
         default_binary_scheme=BinarySchemes.SSCC_96,
         default_filter_value=FilterValues.ALL_OTHERS,
     ):
-        self.company_prefix = str(company_prefix)
+        # The data fields are read-only properties over these slots
+        self._company_prefix = str(company_prefix)
         self.validate_company_prefix()
 
-        self.extension_digit = str(extension_digit)
-        self.serial_ref = str(serial_ref)
-
-        # The number of characters in the company_prefix and serial
-        # must total 17
-        self.extn_and_serial_ref = "{}{}".format(extension_digit, serial_ref).zfill(
-            17 - len(self.company_prefix)
-        )
+        self._extension_digit = str(extension_digit)
+        self._serial_ref = str(serial_ref)
 
         # Store the defaults for creating tag URIs.
         self.default_binary_scheme = default_binary_scheme
         self.default_filter_value = default_filter_value
 
+    @property
+    def extn_and_serial_ref(self):
+        """
+        The extension digit followed by the serial reference, as used
+        in the URIs. Computed on first use and cached.
+        """
+        try:
+            return self._extn_and_serial_ref
+        except AttributeError:
+            pass
+
+        # The number of characters in the company_prefix and serial
+        # must total 17
+        self._extn_and_serial_ref = f"{self.extension_digit}{self.serial_ref}".rjust(
+            17 - len(self.company_prefix), "0"
+        )
+        return self._extn_and_serial_ref
+
     def get_uri_body_parts(self):
-        return [
-            self.company_prefix,
-            self.extn_and_serial_ref,
-        ]
+        try:
+            return self._uri_body_parts
+        except AttributeError:
+            pass
+
+        self._uri_body_parts = (self.company_prefix, self.extn_and_serial_ref)
+        return self._uri_body_parts
 
     def validate_sscc_96(self):
         """
@@ -150,40 +190,47 @@ class SSCC(EPC):
     def _encode_sscc(self):
         """
         Encode the SSCC part of the URI
+
+        The digits are parsed and packed only once and the result is
+        cached on the instance for later encodes.
+
+        :return: The 61 bit SSCC as an integer
         """
-        for ptr in self.partition_table:
-            if ptr.l == self.company_prefix_digits:  # noqa
-                break
-        else:
+        try:
+            return self._sscc_int
+        except AttributeError:
+            pass
+
+        ptr = self._ptr_by_l.get(self.company_prefix_digits)
+        if ptr is None:
             raise EncodingError("Length of Company Prefix is invalid")
 
-        return utils.encode_partition_table(
-            ptr.p, self.company_prefix, ptr.m, self.extn_and_serial_ref, ptr.n, 61
+        self._sscc_int = utils.pack_fields(
+            [
+                (ptr.p, 3),
+                (int(self.company_prefix), ptr.m),
+                (int(self.extn_and_serial_ref), ptr.n),
+            ]
         )
+        return self._sscc_int
 
     @classmethod
-    def _decode_sscc(cls, sscc_binary):
+    def _decode_sscc(cls, sscc):
         """
         Decode the SSCC part of the epc binary
 
+        :param sscc: The 61 bit SSCC as an integer
         :return: A tuple of company prefix, serial ref
         """
-        assert len(sscc_binary) == 61
-
-        partition = int(utils.decode_integer(sscc_binary[:3]))
-        for ptr in cls.partition_table:
-            if ptr.p == partition:  # noqa
-                break
-        else:
+        partition = sscc >> 58
+        ptr = cls._ptr_by_p.get(partition)
+        if ptr is None:
             raise DecodingError("Length of Company Prefix is invalid")
 
-        return utils.decode_partition_table(
-            sscc_binary,
-            ptr.m,
-            ptr.l,
-            ptr.n,
-            # Total of 13 chars
-            17 - ptr.l,
+        return (
+            str((sscc >> ptr.n) & ptr.m_mask).zfill(ptr.l),
+            # Total of 17 chars
+            str(sscc & ptr.n_mask).zfill(17 - ptr.l),
         )
 
     def encode_sscc_96(self, filter_value):
@@ -200,53 +247,41 @@ class SSCC(EPC):
         # │    8     │  3   │    3    │    20-40     │   38-18   │        │
         # └──────────┴──────┴─────────┴──────────────┴───────────┴────────┘
 
-        # EPC Header
-        # 8-bits
-        #
-        # for sscc-96 is 0x31
-        binary = utils.encode_integer(0x31, 8)
-
-        # Filter
-        # 3 bits
-        binary += utils.encode_integer(int(filter_value.value), 3)
-
-        # SSCC = Partition + Company Prefix + Serial Ref
-        # 61 bits
-        binary += self._encode_sscc()
-
-        # Fill the reserved bits with 0
-        binary += "0" * 24
-
-        assert len(binary) == 96
+        binary = utils.pack_fields(
+            [
+                # EPC Header
+                # 8-bits
+                #
+                # for sscc-96 is 0x31
+                (0x31, 8),
+                # Filter
+                # 3 bits
+                (filter_value.int_value, 3),
+                # SSCC = Partition + Company Prefix + Serial Ref
+                # 61 bits
+                (self._encode_sscc(), 61),
+                # Fill the reserved bits with 0
+                (0, 24),
+            ]
+        )
 
-        return utils.bin_2_hex(binary)
+        return utils.int_2_hex(binary, 96)
 
     @classmethod
-    def decode(cls, epc_hex):
+    def _decode_sscc_96(cls, epc_hex):
         """
         Decode and return a SSCC object from the given EPC.
         """
-        header = epc_hex[:2]
-        if header == "31":
-            return cls._decode_sscc_96(utils.hex_2_bin(epc_hex, 96))
-        else:
-            raise DecodingError("{} is not a valid header for SSCC".format(header))
-
-    @classmethod
-    def _decode_sscc_96(cls, epc_binary):
-        """
-        Decode and return a SSCC object from the given EPC.
-        """
-        if len(epc_binary) != 96:
+        if len(epc_hex) < 24:
             raise DecodingError(
-                "sscc-96 EPCs should have 96 bits. Found {}".format(len(epc_binary))
+                "sscc-96 EPCs should have 96 bits. Found {}".format(len(epc_hex) * 4)
             )
         # ┌──────────┬──────┬────────────────────────────────────┬────────┐
         # │EPC HEADER│FILTER│                SSCC                │Reserved│
-        # │    8     │  3   │                 61                 │        │
+        # │    8     │  3   │                 61                 │   24   │
         # └──────────┴──────┴────────────────────────────────────┴────────┘
-        sscc_96_struct = struct.Struct("8s 3s 61s 24s")
-        header, filter_value, sscc, reserved = sscc_96_struct.unpack(epc_binary)
+        epc_int = utils.hex_2_int(epc_hex, 96)
+        sscc = (epc_int >> 24) & ((1 << 61) - 1)
         company_prefix, serial_ref = cls._decode_sscc(sscc)
         return cls(
             company_prefix,
@@ -293,7 +328,15 @@ class SSCC(EPC):
     def sscc(self):
         """
         Return the SSCC in "plain" syntax
+
+        The SSCC (and its check digit) is computed once and cached
+        on the instance.
         """
+        try:
+            return self._sscc
+        except AttributeError:
+            pass
+
         sscc_wo_check_digit = "".join(
             [
                 self.extension_digit,
@@ -301,16 +344,14 @@ class SSCC(EPC):
                 self.serial_ref.zfill(16 - len(self.company_prefix)),
             ]
         )
-        return sscc_wo_check_digit + utils.calculate_check_digit(sscc_wo_check_digit)
+        self._sscc = sscc_wo_check_digit + utils.calculate_check_digit(
+            sscc_wo_check_digit
+        )
+        return self._sscc
 
     def get_gs1_element_string(self):
         """
         Return a GS1 element string for SSCC
         """
-        return "".join(
-            [
-                # GS1 Application identifier for SSCC is 00
-                "(00)",
-                self.sscc,
-            ]
-        )
+        # GS1 Application identifier for SSCC is 00
+        return f"(00){self.sscc}"
@@ -5,12 +5,17 @@ the first part is an 8 bit header, followed by tag data. The
 overall length, structure and function is determined by the
 header.
 """
-from __future__ import unicode_literals
-from builtins import str
+from functools import lru_cache
+import json
+import os
+import tempfile
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .exceptions import EncodingError
+from .exceptions import DecodingError, EncodingError
 
 
 def encode_integer(value, bits):
@@ -20,8 +25,7 @@ def encode_integer(value, bits):
 
     b-bit integer (padded to the left with zero bits as necessary)
     """
-    fmt_str = "0{bits}b".format(bits=bits)
-    rv = format(int(value), fmt_str)
+    rv = f"{int(value):0{bits}b}"
     if len(rv) > bits:
         raise EncodingError("Cannot fit integer '{}' into {} bits".format(value, bits))
     return rv
@@ -50,13 +54,7 @@ def encode_string(value, bits):
 
     Pad with zero bits as necessary to total bits
     """
-    rv = ""
-    assert len(value) <= bits / 7, "String {} is too long".format(value)
-    for char in str(value).encode("ascii"):
-        rv += encode_integer(char, 7)
-
-    # Pad with zero bits as necessary to total bits
-    return "{rv:0<{bits}}".format(rv=rv, bits=bits)
+    return encode_integer(pack_string(value, bits), bits)
 
 
 def decode_string(value):
@@ -64,14 +62,40 @@ def decode_string(value):
     Implements the string decoding method defined in section
     14.4.2 of the EPC Tag Data Standard
     """
-    size = 7
-    return "".join(
-        [
-            chr(int(value[i : i + size], 2))
-            for i in range(0, len(value), size)
-            if int(value[i : i + size], 2) != 0
-        ]
-    )
+    if not value:
+        return ""
+    return unpack_string(int(value, 2), len(value))
+
+
+def pack_string(value, bits):
+    """
+    Integer equivalent of `encode_string`
+
+    Each character is packed into 7 bits, and the result is padded
+    with zero bits as necessary to total bits
+    """
+    chars = value.encode("ascii")
+    if len(chars) * 7 > bits:
+        raise EncodingError("String {} is too long".format(value))
+    rv = 0
+    for char in chars:
+        rv = (rv << 7) | char
+    return rv << (bits - 7 * len(chars))
+
+
+def unpack_string(value, bits):
+    """
+    Integer equivalent of `decode_string`
+
+    Read 7 bit characters from the most significant end of an integer
+    of `bits` bits, skipping the zero padding
+    """
+    chars = bytearray()
+    for shift in range(bits - 7, -1, -7):
+        char = (value >> shift) & 0x7F
+        if char:
+            chars.append(char)
+    return chars.decode("ascii")
 
 
 def encode_partition_table(partition, var1, var1_bits, var2, var2_bits, bits):
@@ -110,76 +134,249 @@ def decode_partition_table(bin_value, var1_bits, var1_digits, var2_bits, var2_di
     )
 
 
-def bin_2_hex(binary):
+def pack_fields(fields):
     """
-    Given the binary string, convert it into hex string
+    Pack a sequence of `(value, bits)` fields into a single integer,
+    most significant field first.
+
+    This is the integer equivalent of concatenating the output of
+    `encode_integer` for each field, without building the binary
+    string.
     """
-    byte = 4
-    return "".join(
-        [
-            "{:X}".format(int(binary[i : i + byte], 2))
-            for i in range(0, len(binary), byte)
-        ]
-    )
+    rv = 0
+    for value, bits in fields:
+        if value >> bits:
+            raise EncodingError(
+                "Cannot fit integer '{}' into {} bits".format(value, bits)
+            )
+        rv = (rv << bits) | value
+    return rv
 
 
-def hex_2_bin(hex_val, bits):
+def int_2_hex(value, bits):
     """
-    Given the hex string, convert it into binary string
+    Given an integer of `bits` bits, convert it into hex string
+
+    If the number of bits is not a multiple of 4, the value is
+    padded to the right with zero bits to fill the last hex digit.
     """
-    return "".join(["{:04b}".format(int(hex_char, 16)) for hex_char in hex_val])[
-        :bits
-    ].encode()
+    digits = -(-bits // 4)
+    size = -(-bits // 8)
+    # bytes.hex() is considerably faster than formatting the int, but
+    # works on whole bytes, so drop the extra digit for odd lengths
+    return (value << (size * 8 - bits)).to_bytes(size, "big").hex()[:digits].upper()
 
 
+def hex_2_int(hex_val, bits):
+    """
+    Given the hex string, return the integer value of its first
+    `bits` bits
+    """
+    # int() also accepts underscores and surrounding whitespace, so
+    # only let ASCII letters and digits through
+    if not (hex_val.isascii() and hex_val.isalnum()):
+        raise DecodingError("'{}' is not a valid hex value".format(hex_val))
+    digits = -(-bits // 4)
+    try:
+        return int(hex_val[:digits], 16) >> (digits * 4 - bits)
+    except ValueError:
+        raise DecodingError("'{}' is not a valid hex value".format(hex_val))
+
+
+# Weighted sum of each possible pair of digits. Counting from the
+# right, the second digit of every pair has the weight of 3, so the
+# check digit can be calculated two digits at a time.
+_CHECK_DIGIT_PAIR_SUMS = {
+    f"{d1}{d2}": d1 + 3 * d2 for d1 in range(10) for d2 in range(10)
+}
+
+
+@lru_cache(maxsize=4096)
 def calculate_check_digit(number):
     """
     Given a number without the check-digit, calculate
     the check digit and return it.
 
+    Results are memoized since the same GTIN or SSCC is often
+    rebuilt many times (for example once per serial number).
+
     See: https://www.gs1.org/services/how-calculate-check-digit-manually
     """
+    # Step 1: Pad odd length numbers with a leading zero so that
+    # the digits can be paired up from the right
+    padded = "0" + number if len(number) % 2 else number
+
     # Step 2: Multiply alternate position by 3 and 1
     # and get the sum
-    step_2 = sum([int(n) * 3 for n in number[::-1][::2]]) + sum(
-        [int(n) for n in number[::-1][1::2]]
-    )
-    if step_2 % 10 == 0:
-        return "0"
+    step_2 = 0
+    try:
+        for i in range(0, len(padded), 2):
+            step_2 += _CHECK_DIGIT_PAIR_SUMS[padded[i : i + 2]]
+    except KeyError:
+        raise ValueError("'{}' is not a number".format(number))
 
     # Subtract the sum from nearest equal or higher multiple of ten
-    return str(10 - (step_2 % 10))
+    return str(-step_2 % 10)
 
 
 # A data store to retreive and store the company prefixes and
 # corresponding lengths. This is required to determine the length
 # of the company prefix and it is variable.
+#
+# Lookups in the table are cached. Callers that change `GCP_LENGTHS`
+# directly must call `clear_gcp_lookup_cache` afterwards.
 GCP_LENGTHS = {}
 
 
-def get_gcp_length(gs1_identification_key):
+def _default_gcp_cache_path():
     """
-    Return the length of the GS1 Company Prefix (GCP)
-    by using the lookup table.
+    Return the path of the GCP length table saved on disk, in the
+    user cache directory (`$XDG_CACHE_HOME` or `~/.cache`), or None
+    if the `PYEPC_NO_GCP_CACHE` environment variable is set
+    """
+    if os.environ.get("PYEPC_NO_GCP_CACHE"):
+        return None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "pyepc", "gcp.json")
+
+
+# The downloaded table is saved here so that new processes do not
+# have to fetch it from GS1 again until it is older than the max age.
+# Set to None to neither read nor write the table on disk.
+GCP_CACHE_PATH = _default_gcp_cache_path()
+GCP_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Session used to download the table, retrying transient failures.
+# Requests are made with a (connect, read) timeout so that a stalled
+# connection does not hang the caller.
+GCP_REQUEST_TIMEOUT = (3.05, 10)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=1,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+def _read_gcp_cache():
+    """
+    Return the GCP length table saved on disk, or None if there is
+    no fresh copy
+    """
+    if GCP_CACHE_PATH is None:
+        return None
+    try:
+        if time.time() - os.path.getmtime(GCP_CACHE_PATH) > GCP_CACHE_MAX_AGE:
+            return None
+        with open(GCP_CACHE_PATH) as cache_file:
+            gcp_lengths = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    # Anything other than a table of prefixes is treated as a miss
+    if not isinstance(gcp_lengths, dict):
+        return None
+    return gcp_lengths
+
+
+def _write_gcp_cache(gcp_lengths):
+    """
+    Save the GCP length table on disk. The file is replaced
+    atomically so concurrent readers never see a partial table.
+    Failing to write the cache is not an error.
+    """
+    if GCP_CACHE_PATH is None:
+        return
+
+    cache_dir = os.path.dirname(GCP_CACHE_PATH)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(gcp_lengths, cache_file)
+        os.replace(temp_path, GCP_CACHE_PATH)
+    except OSError:
+        # Do not leave a partial table behind, e.g. on a full disk
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def load_gcp_lengths(use_cache=True):
+    """
+    Load the GCP length table into `GCP_LENGTHS`.
 
-    This is an implementation of the procedure outlines in
-    section 5.6.3 of the GS1 RFID/Barcode Interoperability Guideline
+    A fresh copy saved on disk is used if available, otherwise the
+    table is downloaded from GS1 and saved for the next process.
     """
-    # If the table has not been loaded yet, load it
-    if not GCP_LENGTHS:
-        response = requests.get(
-            "https://www.gs1.org/sites/default/files/docs/gcp_length/gcpprefixformatlist.json"  # noqa
+    gcp_lengths = _read_gcp_cache() if use_cache else None
+    if gcp_lengths is None:
+        response = _SESSION.get(
+            "https://www.gs1.org/sites/default/files/docs/gcp_length/gcpprefixformatlist.json",  # noqa
+            timeout=GCP_REQUEST_TIMEOUT,
         ).json()
-        for entry in response["GCPPrefixFormatList"]["entry"]:
-            GCP_LENGTHS[entry["prefix"]] = entry["gcpLength"]
+        gcp_lengths = {
+            entry["prefix"]: entry["gcpLength"]
+            for entry in response["GCPPrefixFormatList"]["entry"]
+        }
+        _write_gcp_cache(gcp_lengths)
+    GCP_LENGTHS.update(gcp_lengths)
+    clear_gcp_lookup_cache()
 
-    # Step 1: Start with the first six digits of the GS1 identification
-    # key (skipping the Indicator Digit of a GTIN, the Extension Digit
-    # of an SSCC or the zero padding digit of a GRAI).
-    # Call this the “candidate prefix”.
-    candidate_prefix = gs1_identification_key[1:]
 
-    for candidate_length in range(11, 2, -1):
+def refresh_gcp_table():
+    """
+    Discard the loaded GCP length table and any cached lookups, and
+    download the table again
+    """
+    GCP_LENGTHS.clear()
+    load_gcp_lengths(use_cache=False)
+
+
+def clear_gcp_lookup_cache():
+    """
+    Clear the cached lookups of `GCP_LENGTHS`. This must be called
+    after changing `GCP_LENGTHS` directly.
+    """
+    _gcp_prefix_lengths.cache_clear()
+    _lookup_gcp_length.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _gcp_prefix_lengths():
+    """
+    Return the distinct prefix lengths in `GCP_LENGTHS` from 11 down
+    to 3 digits. The table only has a few of them, so there is no
+    need to try every length.
+    """
+    return sorted(
+        {len(prefix) for prefix in GCP_LENGTHS if 3 <= len(prefix) <= 11}, reverse=True
+    )
+
+
+@lru_cache(maxsize=8192)
+def _lookup_gcp_length(candidate_prefix):
+    """
+    Find the GCP length for the candidate prefix in `GCP_LENGTHS`.
+
+    Lookups for the same company are repeated on every tag, so the
+    results are cached.
+
+    :param candidate_prefix: The 11 digits following the first digit of
+                             the GS1 identification key. Longer prefixes
+                             are never looked up.
+    """
+    for candidate_length in _gcp_prefix_lengths():
         # Take the first part (starting with first 6 digits)
         # and lookup if an entry exists. If there is one, return the
         # value.
@@ -189,3 +386,22 @@ def get_gcp_length(gs1_identification_key):
 
         # If not increase the digit and then check until all
         # all the way down to 3 digits
+
+
+def get_gcp_length(gs1_identification_key):
+    """
+    Return the length of the GS1 Company Prefix (GCP)
+    by using the lookup table.
+
+    This is an implementation of the procedure outlines in
+    section 5.6.3 of the GS1 RFID/Barcode Interoperability Guideline
+    """
+    # If the table has not been loaded yet, load it
+    if not GCP_LENGTHS:
+        load_gcp_lengths()
+
+    # Step 1: Start with the first six digits of the GS1 identification
+    # key (skipping the Indicator Digit of a GTIN, the Extension Digit
+    # of an SSCC or the zero padding digit of a GRAI).
+    # Call this the “candidate prefix”.
+    return _lookup_gcp_length(gs1_identification_key[1:12])
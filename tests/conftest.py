@@ -0,0 +1,12 @@
+import pytest
+
+from pyepc import utils
+
+
+@pytest.fixture(autouse=True)
+def gcp_cache_path(monkeypatch, tmp_path):
+    """
+    Keep the GCP length table that tests download out of the user's
+    cache directory
+    """
+    monkeypatch.setattr(utils, "GCP_CACHE_PATH", str(tmp_path / "pyepc" / "gcp.json"))
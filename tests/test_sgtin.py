@@ -1,10 +1,10 @@
-from __future__ import unicode_literals
+import weakref
 
 import pytest
 
 
-from pyepc import SGTIN
-from pyepc.exceptions import EncodingError
+from pyepc import SGTIN, SSCC
+from pyepc.exceptions import EncodingError, UnknownEncodingScheme
 
 
 def test_sgtin_no_serial():
@@ -81,3 +81,56 @@ def test_epc_from_gtin():
 def test_gtin_from_epc():
     decoded = SGTIN.decode("3036142C8C008F8000053244")
     assert decoded.gtin == "08719139005740", "Decoded GTIN is wrong"
+
+
+def test_sgtin_198_full_length_serial():
+    # A 20 character serial uses all 140 serial bits, so the
+    # last hex digit holds the final two bits padded with zeros
+    sgtin = SGTIN("0614141", "8", "12345", "ABCDEFGHIJKLMNOPQRST")
+    epc_hex = sgtin.encode()
+    assert epc_hex == "3634257BF7194E60C287122C68F224CA97326CE9F428D2A750"
+    assert SGTIN.decode(epc_hex) == sgtin
+
+
+def test_sgtin_hashable():
+    sgtins = {
+        SGTIN("0614141", "8", "12345", "6789"),
+        SGTIN.decode("3034257BF7194E4000001A85"),
+        SGTIN("0614141", "8", "12345", "6790"),
+    }
+    assert len(sgtins) == 2
+    assert SGTIN("0614141", "8", "12345", "6789") in sgtins
+
+
+def test_sgtin_equality():
+    sgtin = SGTIN("0614141", "8", "12345", "6789")
+    # Same pure identity URI, even though the item reference is split
+    # differently from the indicator
+    assert sgtin == SGTIN("0614141", "81", "2345", "6789")
+    assert sgtin != SGTIN("0614141", "8", "12345", "6790")
+    assert sgtin != SSCC("0614141", "8", "12345")
+    assert sgtin != "urn:epc:id:sgtin:0614141.812345.6789"
+
+
+def test_sgtin_unknown_binary_scheme():
+    sgtin = SGTIN("0614141", "8", "12345", "6789")
+    with pytest.raises(UnknownEncodingScheme):
+        sgtin.encode(SSCC.BinarySchemes.SSCC_96)
+
+
+def test_sgtin_read_only_fields():
+    sgtin = SGTIN("0614141", "8", "12345", "6789")
+    assert sgtin.encode() == "3034257BF7194E4000001A85"
+
+    # Cached values can never go stale, because the data fields
+    # cannot be assigned
+    for field in ("company_prefix", "indicator", "item_ref", "serial_number"):
+        with pytest.raises(AttributeError):
+            setattr(sgtin, field, "7000")
+    assert sgtin.encode() == "3034257BF7194E4000001A85"
+    assert sgtin in {SGTIN("0614141", "8", "12345", "6789")}
+
+
+def test_sgtin_weakref():
+    sgtin = SGTIN("0614141", "8", "12345", "6789")
+    assert weakref.ref(sgtin)() is sgtin
@@ -1,7 +1,7 @@
-from __future__ import unicode_literals
-
+import pytest
 
 from pyepc import SSCC, decode
+from pyepc.exceptions import DecodingError
 
 
 def test_sscc():
@@ -23,3 +23,31 @@ def test_epc_from_sscc():
 
 def test_decode():
     assert decode("3114257BF4499602D2000000") == SSCC("0614141", "1", "234567890")
+
+
+def test_decode_returns_new_objects():
+    # Changing one decoded object does not affect the others
+    decoded = decode("3114257BF4499602D2000000")
+    decoded.default_filter_value = SSCC.FilterValues.CASE
+    assert decode("3114257BF4499602D2000000").get_tag_uri() == (
+        "urn:epc:tag:sscc-96:0.0614141.1234567890"
+    )
+
+
+def test_decode_invalid():
+    # Unknown header
+    with pytest.raises(DecodingError):
+        decode("FF14257BF4499602D2000000")
+    # Not a plain hex value
+    with pytest.raises(DecodingError):
+        decode("3114257BF4499602D2_00000")
+
+
+def test_sscc_read_only_fields():
+    sscc = SSCC("0614141", "1", "234567890")
+    assert sscc.encode() == "3114257BF4499602D2000000"
+
+    for field in ("company_prefix", "extension_digit", "serial_ref"):
+        with pytest.raises(AttributeError):
+            setattr(sscc, field, "234567891")
+    assert sscc.encode() == "3114257BF4499602D2000000"
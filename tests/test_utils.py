@@ -1,15 +1,21 @@
-from __future__ import unicode_literals
-
 import pytest
 
-from pyepc.exceptions import EncodingError
+from pyepc import utils
+
+from pyepc.exceptions import DecodingError, EncodingError
 from pyepc.utils import (
     encode_integer,
     encode_hex,
     encode_string,
     decode_string,
+    pack_string,
+    unpack_string,
     calculate_check_digit,
+    int_2_hex,
+    hex_2_int,
     get_gcp_length,
+    encode_partition_table,
+    decode_partition_table,
 )
 
 
@@ -44,9 +50,121 @@ def test_encode_string():
     assert decode_string("11000011100010") == "ab"
 
 
+def test_pack_string():
+    assert pack_string("ab", 14) == 0b11000011100010
+    assert pack_string("a", 14) == 0b11000010000000
+    assert unpack_string(0b11000011100010, 14) == "ab"
+    assert unpack_string(pack_string("6789AB", 140), 140) == "6789AB"
+
+    with pytest.raises(EncodingError):
+        pack_string("abc", 14)
+
+
+def test_int_2_hex():
+    assert int_2_hex(0x3034257BF7194E4000001A85, 96) == "3034257BF7194E4000001A85"
+    assert int_2_hex(0xABC, 12) == "ABC"
+    # Padded to the right with zero bits to fill the last hex digit
+    assert int_2_hex(0b11, 198) == "0" * 49 + "C"
+    assert hex_2_int("0" * 49 + "C", 198) == 0b11
+    for invalid in ("3034257BF7194E40_0001A85", "3034257BF7194E4000001A8 ", "30342G"):
+        with pytest.raises(DecodingError):
+            hex_2_int(invalid, 96)
+
+
 def test_check_digits():
     assert calculate_check_digit("629104150021") == "3"
+    # Odd number of digits (GTIN-14 and SSCC)
+    assert calculate_check_digit("8061414112345") == "8"
+    assert calculate_check_digit("10614141234567890") == "8"
+    # Weighted sum is already a multiple of ten
+    assert calculate_check_digit("0000000000000") == "0"
+    with pytest.raises(ValueError):
+        calculate_check_digit("806141412a45")
 
 
 def test_get_gcp_length():
     assert get_gcp_length("80614141123458") == 7
+
+
+def test_get_gcp_length_cached(monkeypatch):
+    monkeypatch.setattr(utils, "GCP_LENGTHS", {"0614141": 7, "061": 3})
+    utils.clear_gcp_lookup_cache()
+    try:
+        assert get_gcp_length("80614141123458") == 7
+        assert get_gcp_length("80619999123458") == 3
+        assert get_gcp_length("80999999123458") is None
+
+        # Only the first 11 digits after the indicator or extension
+        # digit are part of the lookup
+        assert get_gcp_length("80614141123465") == 7
+        assert get_gcp_length("106141412345678908") == 7
+
+        # Changes made to the table directly are picked up once the
+        # cached lookups are cleared, even if the size stays the same
+        del utils.GCP_LENGTHS["0614141"]
+        utils.GCP_LENGTHS["06141411"] = 8
+        utils.clear_gcp_lookup_cache()
+        assert get_gcp_length("80614141123458") == 8
+        assert get_gcp_length("80619999123458") == 3
+    finally:
+        utils.clear_gcp_lookup_cache()
+
+
+def test_load_gcp_lengths_from_disk_cache(monkeypatch, tmp_path):
+    cache_path = tmp_path / "pyepc" / "gcp.json"
+    monkeypatch.setattr(utils, "GCP_CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(utils, "GCP_LENGTHS", {})
+
+    utils._write_gcp_cache({"0614141": 7})
+    assert utils._read_gcp_cache() == {"0614141": 7}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The table should not be downloaded")
+
+    monkeypatch.setattr(utils._SESSION, "get", fail)
+    utils.load_gcp_lengths()
+    assert utils.GCP_LENGTHS == {"0614141": 7}
+
+    # A stale copy is ignored
+    monkeypatch.setattr(utils, "GCP_CACHE_MAX_AGE", -1)
+    assert utils._read_gcp_cache() is None
+
+
+def test_gcp_cache_path(monkeypatch, tmp_path):
+    monkeypatch.delenv("PYEPC_NO_GCP_CACHE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert utils._default_gcp_cache_path() == str(tmp_path / "pyepc" / "gcp.json")
+
+    monkeypatch.setenv("PYEPC_NO_GCP_CACHE", "1")
+    assert utils._default_gcp_cache_path() is None
+
+    # Nothing is read or written without a path
+    monkeypatch.setattr(utils, "GCP_CACHE_PATH", None)
+    utils._write_gcp_cache({"0614141": 7})
+    assert utils._read_gcp_cache() is None
+
+
+def test_write_gcp_cache_failure(monkeypatch, tmp_path):
+    monkeypatch.setattr(utils, "GCP_CACHE_PATH", str(tmp_path / "gcp.json"))
+
+    def fail(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(utils.json, "dump", fail)
+    utils._write_gcp_cache({"0614141": 7})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_partition_table():
+    # SGTIN partition 5: 24 bit company prefix, 20 bit item reference
+    bin_value = encode_partition_table(5, "0614141", 24, "812345", 20, 47)
+    assert bin_value.startswith("101")
+    assert decode_partition_table(bin_value, 24, 7, 20, 6) == ("0614141", "812345")
+
+
+def test_read_gcp_cache_invalid(monkeypatch, tmp_path):
+    cache_path = tmp_path / "gcp.json"
+    monkeypatch.setattr(utils, "GCP_CACHE_PATH", str(cache_path))
+    for content in ('"0614141"', '[["0614141"]]', "{"):
+        cache_path.write_text(content)
+        assert utils._read_gcp_cache() is None